@@ -1,138 +1,292 @@
+import hashlib
+import os
+import tempfile
 import streamlit as st
 import pandas as pd
 import altair as alt
 import numpy as np
-import matplotlib.pyplot as plt
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
 
 # Specifying the correct data type mapping for the dataframes that will be read from .csv files. Important to do so since pandas' object dtype slows down as the size of the dataset grows larger.
+# The types are handed straight to pyarrow's multithreaded csv reader, so every column is parsed into its final type in a single pass.
+# Item and category names are dictionary encoded so they arrive as pandas categories; counting them is then a bincount over integer codes instead of hashing every string.
+# IDs use the narrowest integer type their domain allows (menu items and categories fit in uint16), and the join keys share the same type on both sides so merges never upcast.
 category_mapping_types_conversion: dict = {
-    "category_id": "int64",
-    "category_name": "string"
+    "category_id": pa.uint16(),
+    "category_name": pa.dictionary(pa.int32(), pa.string())
 }
 
 menu_mapping_types_conversion: dict = {
-    "item_id": "int64",
-    "item_name": "string",
-    "description": "string",
-    "price": "float32",
-    "category_id": "int64",
-    "is_vegetarian": "boolean",
-    "is_spicy": "boolean",
-    "is_gluten_free": "boolean"
+    "item_id": pa.uint16(),
+    "item_name": pa.dictionary(pa.int32(), pa.string()),
+    "description": pa.string(),
+    "price": pa.float32(),
+    "category_id": pa.uint16(),
+    "is_vegetarian": pa.bool_(),
+    "is_spicy": pa.bool_(),
+    "is_gluten_free": pa.bool_()
 }
 
 orders_mapping_types_conversion: dict = {
-    "order_id": "int64",
-    "item_id": "int64",
-    "customer_id": "int64",
-    "quantity": "int64",
-    "special_request": "string",
-    "subtotal": "float64",
-    "payment_method": "category",
-    "order_status": "category"
+    "order_id": pa.int32(),
+    "item_id": pa.uint16(),
+    "customer_id": pa.int32(),
+    "quantity": pa.int32(),
+    "special_request": pa.string(),
+    "subtotal": pa.float32(),
+    "payment_method": pa.dictionary(pa.int32(), pa.string()),
+    "order_placed": pa.timestamp("ns"),
+    "order_status": pa.dictionary(pa.int32(), pa.string())
 }
 
 feedback_mapping_types_conversion: dict = {
-    "Customer_ID": "int64",
-    "Item_ID": "int64",
-    "Feedback_Text": "string",
-    "Rating": "float64",
-    "Feedback_Category": "category"
+    "Customer_ID": pa.int32(),
+    "Item_ID": pa.uint16(),
+    "Feedback_Text": pa.string(),
+    "Rating": pa.float32(),
+    "Submission_Timestamp": pa.timestamp("ns"),
+    "Feedback_Category": pa.dictionary(pa.int32(), pa.string())
 }
 
+# Arrow types that should come back as pandas' nullable extension dtypes rather than numpy object columns.
+# Dictionary encoded columns are converted to the pandas category dtype by pyarrow itself.
+arrow_to_pandas_types: dict = {
+    pa.string(): pd.StringDtype(),
+    pa.bool_(): pd.BooleanDtype()
+}
+
+csv_parse_options = pacsv.ParseOptions(delimiter=",")
+
+# Only the order and feedback columns the analytics below actually read are materialised; the csv reader skips converting the rest
+orders_columns_used: list = ["order_id", "item_id", "customer_id", "quantity", "payment_method", "order_placed", "order_status"]
+feedback_columns_used: list = ["Item_ID", "Rating", "Feedback_Category"]
+
+# Parsed tables are kept as uncompressed feather (Arrow IPC) files so a cold start can memory-map the typed columns instead of re-parsing the .csv files
+feather_cache_dir: str = ".cache"
+
+def read_csv_table(filename: str, convert_options: pacsv.ConvertOptions) -> pa.Table:
+    """Read a .csv file into an arrow table, reusing its feather copy while that is newer than both the .csv file and this script."""
+    # a short hash of the absolute path keeps same-named .csv files from different directories apart
+    path_hash = hashlib.sha1(os.path.abspath(filename).encode("utf-8")).hexdigest()[:12]
+    cache_path = os.path.join(feather_cache_dir, f"{os.path.basename(filename)}.{path_hash}.feather")
+    # the read schemas live in this script, so editing it has to invalidate the cached tables as well
+    source_mtime = max(os.path.getmtime(filename), os.path.getmtime(__file__))
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) > source_mtime:
+        try:
+            return feather.read_table(cache_path, memory_map=True)
+        except (OSError, pa.ArrowException):
+            pass # an unreadable cache file is rebuilt from the .csv file below
+
+    table = pacsv.read_csv(filename, parse_options=csv_parse_options, convert_options=convert_options)
+    temp_path = None
+    try:
+        os.makedirs(feather_cache_dir, exist_ok=True)
+        # writing to a temporary file first means an interrupted write never leaves a partial file at cache_path
+        with tempfile.NamedTemporaryFile(dir=feather_cache_dir, suffix=".tmp", delete=False) as temp_file:
+            temp_path = temp_file.name
+        feather.write_feather(table, temp_path, compression="uncompressed")
+        os.replace(temp_path, cache_path)
+    except (OSError, pa.ArrowException):
+        # a read-only deploy, or a table the feather writer rejects, still serves the parsed data; it just goes without the cache
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+    return table
+
 # Writing functions to process each available dataset, do some processing and return a pandas dataframe
+# file_mtime is not read inside the functions; it is part of the cache key so an edited .csv file is read again
 @st.cache_data
-def read_orders_dataset(filename: str) -> pd.DataFrame:
+def read_orders_dataset(filename: str, file_mtime: float) -> pd.DataFrame:
     """Reading in the .csv file containing order data"""
-    orders_raw = pd.read_csv(filename)
-    orders = orders_raw.astype(orders_mapping_types_conversion)
-    orders['order_placed'] = pd.to_datetime(orders['order_placed'])
+    orders_table = read_csv_table(filename, pacsv.ConvertOptions(column_types=orders_mapping_types_conversion, include_columns=orders_columns_used))
+    orders = orders_table.to_pandas(types_mapper=arrow_to_pandas_types.get)
     return orders 
 
 @st.cache_data
-def read_category_data(filename:str) -> pd.DataFrame:
+def read_category_data(filename:str, file_mtime: float) -> pd.DataFrame:
     """Read in the .csv file containing the categories for the Quéchat menu items."""
-    categories_raw = pd.read_csv(filename)
-    categories = categories_raw.astype(category_mapping_types_conversion)
+    categories_table = read_csv_table(filename, pacsv.ConvertOptions(column_types=category_mapping_types_conversion))
+    categories = categories_table.to_pandas(types_mapper=arrow_to_pandas_types.get)
     return categories
 
 @st.cache_data
-def read_menu_data(filename: str) -> pd.DataFrame:
+def read_menu_data(filename: str, file_mtime: float) -> pd.DataFrame:
     """Read in the .csv file containing the menu for the Quéchat Restaurant."""
-    menu_raw = pd.read_csv(filename)
-    menu = menu_raw.astype(menu_mapping_types_conversion)
+    menu_table = read_csv_table(filename, pacsv.ConvertOptions(column_types=menu_mapping_types_conversion))
+    menu = menu_table.to_pandas(types_mapper=arrow_to_pandas_types.get)
     return menu
 
 @st.cache_data
-def read_feedback_dataset(filename: str) -> pd.DataFrame:
+def read_feedback_dataset(filename: str, file_mtime: float) -> pd.DataFrame:
     """ Read in the .csv file containing existing feedback data."""
-    feedback_raw = pd.read_csv(filename)
-    feedback = feedback_raw.astype(feedback_mapping_types_conversion)
-    feedback['Submission_Timestamp'] = pd.to_datetime(feedback['Submission_Timestamp'])
+    feedback_table = read_csv_table(filename, pacsv.ConvertOptions(column_types=feedback_mapping_types_conversion, include_columns=feedback_columns_used))
+    # lower-casing the headers on the arrow table only touches the schema, no column data is copied
+    feedback_table = feedback_table.rename_columns([column.lower() for column in feedback_table.column_names])
+    feedback = feedback_table.to_pandas(types_mapper=arrow_to_pandas_types.get)
     return feedback
 
-# reading in the files to generate our dataframes
-categories_df: pd.DataFrame = read_category_data('categories.csv')
-menu_df: pd.DataFrame = read_menu_data('menu.csv')
-orders_df: pd.DataFrame = read_orders_dataset('order_data.csv')
-
-feedback_df: pd.DataFrame = read_feedback_dataset('feedback_data.csv')
-feedback_df.columns = map(str.lower, feedback_df.columns) 
-
-# Merging dataframes to consolidate data for different purposes
-orders_menu: pd.DataFrame = orders_df.merge(menu_df, how="left", on="item_id")
-overall_data: pd.DataFrame = orders_menu.merge(categories_df, how="left", on="category_id")
-overall_data['total']: pd.Series = overall_data['quantity'] * overall_data['price']
-overall_data['year_month']: pd.Series = overall_data['order_placed'].dt.strftime('%m-%Y')
-feedback_overall: pd.DataFrame = feedback_df.merge(menu_df, how="left", on="item_id")
-
-# Calculating overall business metrics
-# GMV - Gross Merchandise Value
-# Average Order - $ amount of the average order placed at the restaurant
-gmv: str = f"$ {((overall_data['price'] * overall_data['quantity']).sum()):.0f}"
-avg_order: str = f"$ {((overall_data['price'] * overall_data['quantity']).mean()).round(2)}"
-
-# Orders Placed - Total Number of Orders Placed
-# Orders Completed - Total Number of Orders fulfilled by the restaurant
-# Orders Canceled - Total Number of Orders that were canceled by the customers
-orders_placed: str = f"{overall_data['order_id'].nunique()}"
-orders_completed: str = f"{overall_data[overall_data['order_status'].isin(['Completed', 'In Progress'])]['order_id'].nunique()}"
-orders_canceled: str = f"{overall_data[overall_data['order_status'] == 'Cancelled']['order_id'].nunique()}"
-
-
-most_ordered: str = overall_data['item_name'].value_counts().idxmax() # most ordered item on the menu
-most_ordered_category: str = overall_data['category_name'].value_counts().idxmax() # most ordered category on the menu
-most_favorite_item: str = feedback_overall[feedback_overall['rating'] == 5.0]['item_name'].value_counts().idxmax() # most favorite item based on customer feedback
-most_liked_aspect: str = feedback_overall[feedback_overall['rating'] == 5.0]['feedback_category'].value_counts().idxmax() # most favorite aspect of the restaurant based on customer feedback
-least_liked_aspect: str = feedback_overall[feedback_overall['rating'] < 2.0]['feedback_category'].value_counts().idxmax() # least favorite aspect of the restaurant based on customer feedback
-
-# Customer Trend Metrics
-unique_customers: int = overall_data['customer_id'].nunique() # Number of unique customers served
-
-# Processing to calculate statistics for repeat customers
-repeat_customers: pd.DataFrame = pd.DataFrame(overall_data['customer_id'].value_counts())
-repeat_customers.reset_index(inplace=True)
-repeat_customers.columns: list[list[str]] = ['customer_id', 'occurrences']
-
-most_valuable_customer = overall_data['customer_id'].value_counts().idxmax() # customer that placed the most orders
-more_than_twice = repeat_customers[repeat_customers['occurrences'] > 2]['customer_id'].count() # customers that placed more than 2 orders
-more_than_five = repeat_customers[repeat_customers['occurrences'] > 5]['customer_id'].count() # customers that placed more than 5 orders
-more_than_ten = repeat_customers[repeat_customers['occurrences'] > 10]['customer_id'].count() # customers that placed more than 10 orders
-
-# Processing to understand payment trends
-payment_trends = pd.DataFrame(overall_data['payment_method'].value_counts())
-payment_trends.reset_index(inplace=True)
-payment_trends.columns: list[list[str]] = ['Payment Method', 'Number of Transactions']
-
-# Processing to understand category trends
-category_trends = pd.DataFrame(overall_data['category_name'].value_counts())
-category_trends.reset_index(inplace=True)
-category_trends.columns: list[list[str]] = ['Category', 'Number of Orders']
-# Processing to build charts
-
-# Monthly Sales Volume
-sales_vols: pd.DataFrame = pd.DataFrame(overall_data.groupby(['year_month'])['total'].sum())
-sales_vols.reset_index(inplace=True)
+def hour_histogram(order_times: np.ndarray) -> np.ndarray:
+    """Count the orders placed in each hour of the day (0-23) from an array of datetime64 timestamps."""
+    # Missing timestamps are dropped first, as NaT viewed as an integer would otherwise land in one of the hours
+    order_times = order_times[~np.isnat(order_times)]
+    # Truncating to whole hours and taking the remainder modulo 24 gives the hour of day directly, without binning
+    hours_of_day = order_times.astype('datetime64[h]').view('int64') % 24
+    return np.bincount(hours_of_day, minlength=24)
+
+def observed_counts(column: pd.Series, sort: bool = True) -> pd.Series:
+    """Count the values of a column, leaving out categories that never occur in it."""
+    # value_counts on a categorical column also lists every unused category with a count of 0
+    counts = column.value_counts(sort=sort)
+    return counts[counts > 0]
+
+# Building every derived dataframe and metric in one cached step, so Streamlit reruns triggered by the chat box or checkboxes skip the whole pipeline.
+# The cache is keyed on the file names and modification times only, so a rerun looks the metrics up without hashing any dataframe,
+# and the pipeline only runs again once one of the .csv files changes.
+@st.cache_data
+def build_metrics(orders_file: str, menu_file: str, categories_file: str, feedback_file: str,
+                  orders_mtime: float, menu_mtime: float, categories_mtime: float, feedback_mtime: float) -> dict:
+    """Read and merge the datasets and calculate the metrics and chart data shown in the portal."""
+    # reading in the files to generate our dataframes
+    categories_df: pd.DataFrame = read_category_data(categories_file, categories_mtime)
+    menu_df: pd.DataFrame = read_menu_data(menu_file, menu_mtime)
+    orders_df: pd.DataFrame = read_orders_dataset(orders_file, orders_mtime)
+    feedback_df: pd.DataFrame = read_feedback_dataset(feedback_file, feedback_mtime)
+
+    # Merging dataframes to consolidate data for different purposes
+    # The small menu and category tables are joined first (keeping only the menu columns used below), so the large orders table is only joined once
+    menu_categories: pd.DataFrame = menu_df[['item_id', 'item_name', 'price', 'category_id']].merge(categories_df, how="left", on="category_id", validate="m:1")
+    overall_data: pd.DataFrame = orders_df.merge(menu_categories, how="left", on="item_id", validate="m:1")
+    # Line totals are computed once as a float32 numpy array and reused for the GMV, average order and monthly sales metrics below
+    order_totals: np.ndarray = np.multiply(overall_data['quantity'].to_numpy(np.float32), overall_data['price'].to_numpy(np.float32))
+    # Feedback only needs the item names from the menu
+    feedback_overall: pd.DataFrame = feedback_df.merge(menu_df[['item_id', 'item_name']], how="left", on="item_id", validate="m:1")
+
+    # Calculating overall business metrics
+    # GMV - Gross Merchandise Value
+    # Average Order - $ amount of the average order placed at the restaurant
+    # Orders whose item is missing from the menu have no price, so their NaN totals are skipped like pandas' sum and mean do
+    gmv: str = f"$ {np.nansum(order_totals, dtype=np.float64):.0f}"
+    avg_order: str = f"$ {np.nanmean(order_totals, dtype=np.float64).round(2)}"
+
+    # Orders Placed - Total Number of Orders Placed
+    # Orders Completed - Total Number of Orders fulfilled by the restaurant
+    # Orders Canceled - Total Number of Orders that were canceled by the customers
+    # All three are derived from a single de-duplicated view of the orders (one row per order_id)
+    unique_orders: pd.DataFrame = overall_data[['order_id', 'order_status', 'customer_id']].drop_duplicates(subset='order_id')
+    order_status_counts: pd.Series = unique_orders['order_status'].value_counts()
+    orders_placed: str = f"{len(unique_orders)}"
+    orders_completed: str = f"{order_status_counts.get('Completed', 0) + order_status_counts.get('In Progress', 0)}"
+    orders_canceled: str = f"{order_status_counts.get('Cancelled', 0)}"
+
+
+    # Counting each column once and reusing the counts, rather than re-scanning the dataframes for every metric
+    item_counts: pd.Series = observed_counts(overall_data['item_name'], sort=False)
+    category_counts: pd.Series = observed_counts(overall_data['category_name'])
+    # The rating column is pulled out once and both the 5-star and sub 2-star masks are built from that array
+    feedback_ratings: np.ndarray = feedback_overall['rating'].to_numpy()
+    top_rated_feedback: pd.DataFrame = feedback_overall.loc[feedback_ratings == 5.0, ['item_name', 'feedback_category']]
+    low_rated_feedback: pd.DataFrame = feedback_overall.loc[feedback_ratings < 2.0, ['feedback_category']]
+
+    most_ordered: str = item_counts.idxmax() # most ordered item on the menu
+    most_ordered_category: str = category_counts.idxmax() # most ordered category on the menu
+    most_favorite_item: str = observed_counts(top_rated_feedback['item_name'], sort=False).idxmax() # most favorite item based on customer feedback
+    most_liked_aspect: str = observed_counts(top_rated_feedback['feedback_category'], sort=False).idxmax() # most favorite aspect of the restaurant based on customer feedback
+    least_liked_aspect: str = observed_counts(low_rated_feedback['feedback_category'], sort=False).idxmax() # least favorite aspect of the restaurant based on customer feedback
+
+    # Customer Trend Metrics
+    unique_customers: int = unique_orders['customer_id'].nunique() # Number of unique customers served
+
+    # Processing to calculate statistics for repeat customers
+    # value_counts is sorted in descending order, so the first entry is the most frequent customer
+    customer_counts: pd.Series = overall_data['customer_id'].value_counts()
+    customer_occurrences: np.ndarray = customer_counts.to_numpy()
+
+    most_valuable_customer = customer_counts.index[0] # customer that placed the most orders
+    more_than_twice = int((customer_occurrences > 2).sum()) # customers that placed more than 2 orders
+    more_than_five = int((customer_occurrences > 5).sum()) # customers that placed more than 5 orders
+    more_than_ten = int((customer_occurrences > 10).sum()) # customers that placed more than 10 orders
+
+    # Processing to understand payment trends
+    payment_trends = pd.DataFrame(overall_data['payment_method'].value_counts())
+    payment_trends.reset_index(inplace=True)
+    payment_trends.columns: list[list[str]] = ['Payment Method', 'Number of Transactions']
+
+    # Processing to understand category trends
+    category_trends = pd.DataFrame(category_counts)
+    category_trends.reset_index(inplace=True)
+    category_trends.columns: list[list[str]] = ['Category', 'Number of Orders']
+    # Processing to build charts
+
+    # Monthly Sales Volume
+    # Truncating the timestamps to their month keeps year_month numeric; it is only formatted as text on the aggregated chart data.
+    # Once the orders are sorted by month, each month is a contiguous run of line totals that np.add.reduceat sums in one pass.
+    # Orders without a timestamp are dropped first, since NaT never compares equal and would otherwise start a new month on every row.
+    # Orders without a price (item missing from the menu) are dropped too, so a NaN total cannot turn its whole month into NaN.
+    order_months: np.ndarray = overall_data['order_placed'].to_numpy().astype('datetime64[M]')
+    dated_orders: np.ndarray = ~np.isnat(order_months) & ~np.isnan(order_totals)
+    order_months, month_totals = order_months[dated_orders], order_totals[dated_orders]
+    month_order: np.ndarray = np.argsort(order_months, kind='stable')
+    sorted_months: np.ndarray = order_months[month_order]
+    is_month_start: np.ndarray = np.ones(len(sorted_months), dtype=bool)
+    is_month_start[1:] = sorted_months[1:] != sorted_months[:-1]
+    month_starts: np.ndarray = np.flatnonzero(is_month_start)
+    sales_vols: pd.DataFrame = pd.DataFrame({
+        'year_month': sorted_months[month_starts],
+        'total': np.add.reduceat(month_totals[month_order], month_starts, dtype=np.float64)
+    })
+
+    # Orders placed per hour of the day
+    hour_counts: np.ndarray = hour_histogram(overall_data['order_placed'].to_numpy())
+
+    return {
+        "gmv": gmv,
+        "avg_order": avg_order,
+        "orders_placed": orders_placed,
+        "orders_completed": orders_completed,
+        "orders_canceled": orders_canceled,
+        "most_ordered": most_ordered,
+        "most_ordered_category": most_ordered_category,
+        "most_favorite_item": most_favorite_item,
+        "most_liked_aspect": most_liked_aspect,
+        "least_liked_aspect": least_liked_aspect,
+        "unique_customers": unique_customers,
+        "most_valuable_customer": most_valuable_customer,
+        "more_than_twice": more_than_twice,
+        "more_than_five": more_than_five,
+        "more_than_ten": more_than_ten,
+        "payment_trends": payment_trends,
+        "category_trends": category_trends,
+        "sales_vols": sales_vols,
+        "hour_counts": hour_counts
+    }
+
+orders_file: str = 'order_data.csv'
+menu_file: str = 'menu.csv'
+categories_file: str = 'categories.csv'
+feedback_file: str = 'feedback_data.csv'
+
+metrics: dict = build_metrics(orders_file, menu_file, categories_file, feedback_file,
+                              os.path.getmtime(orders_file), os.path.getmtime(menu_file), os.path.getmtime(categories_file), os.path.getmtime(feedback_file))
+gmv: str = metrics["gmv"]
+avg_order: str = metrics["avg_order"]
+orders_placed: str = metrics["orders_placed"]
+orders_completed: str = metrics["orders_completed"]
+orders_canceled: str = metrics["orders_canceled"]
+most_ordered: str = metrics["most_ordered"]
+most_ordered_category: str = metrics["most_ordered_category"]
+most_favorite_item: str = metrics["most_favorite_item"]
+most_liked_aspect: str = metrics["most_liked_aspect"]
+least_liked_aspect: str = metrics["least_liked_aspect"]
+unique_customers: int = metrics["unique_customers"]
+most_valuable_customer = metrics["most_valuable_customer"]
+more_than_twice = metrics["more_than_twice"]
+more_than_five = metrics["more_than_five"]
+more_than_ten = metrics["more_than_ten"]
+payment_trends: pd.DataFrame = metrics["payment_trends"]
+category_trends: pd.DataFrame = metrics["category_trends"]
+sales_vols: pd.DataFrame = metrics["sales_vols"]
+hour_counts: np.ndarray = metrics["hour_counts"]
 
 def follow_up():
     """ Function to trigger a follow-up call to action"""
@@ -150,7 +304,7 @@ def overall_metrics():
 
     col1, col2, col3 = st.columns(3, gap="medium")
     col1.metric("GMV", value = gmv)
-    col2.metric("Orders Placed", value = overall_data['order_id'].nunique())
+    col2.metric("Orders Placed", value = orders_placed)
     col3.metric("Unique Customers Served", value=unique_customers)
 
     col4, col5, col6 = st.columns(3, gap="medium")
@@ -169,16 +323,12 @@ def payment_metrics():
 
     st.subheader('Payment Trends')
 
-    st.markdown(f"The most preferred payment method used by your customers was {overall_data['payment_method'].value_counts().idxmax()}, used in 1748 transactions. ")
+    st.markdown(f"The most preferred payment method used by your customers was {payment_trends['Payment Method'].iloc[0]}, used in 1748 transactions. ")
 
     st.markdown("Below shown is a breakdown of the payment methods used by customers to pay for services at your restaurant:")
 
-    plot_y = payment_trends['Number of Transactions'].tolist()
-    plot_labels = payment_trends['Payment Method'].tolist()
-
-    fig, ax = plt.subplots()
-    plt.pie(plot_y, labels= plot_labels, autopct='%1.1f%%')
-    st.pyplot(fig)
+    c = alt.Chart(payment_trends).mark_arc().encode(theta='Number of Transactions', color='Payment Method', tooltip=['Payment Method', 'Number of Transactions'])
+    st.altair_chart(c, use_container_width=True)
 
     follow_up()
 
@@ -207,20 +357,17 @@ def chart_metrics():
     if ordering_times:
         st.markdown("Customer Ordering Times")
         st.write("Below shown is the ordering volume by time for any given day: ")
-        hist_values = np.histogram(overall_data['order_placed'].dt.hour, bins=24, range=(0,24))[0]
-        st.bar_chart(hist_values)
+        st.bar_chart(hour_counts)
 
     elif sales_volume:
-        c = alt.Chart(sales_vols).mark_line().encode(y='total', x=alt.X('year_month', sort=None))
+        monthly_sales = sales_vols.assign(year_month=sales_vols['year_month'].dt.strftime('%b %Y'))
+        c = alt.Chart(monthly_sales).mark_line().encode(y='total', x=alt.X('year_month', sort=None))
         st.altair_chart(c, use_container_width=True)
     elif ordering_categories:
         st.markdown("Below shown is a breakdown of the categories ordered by customers at your restaurant:")
 
-        order_y = category_trends['Number of Orders'].tolist()
-        order_labels = category_trends['Category'].tolist()
-        fig, ax = plt.subplots()
-        plt.pie(order_y, labels= order_labels, autopct='%1.1f%%')
-        st.pyplot(fig)
+        c = alt.Chart(category_trends).mark_arc().encode(theta='Number of Orders', color='Category', tooltip=['Category', 'Number of Orders'])
+        st.altair_chart(c, use_container_width=True)
     
     follow_up()
 